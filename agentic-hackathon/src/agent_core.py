@@ -1,5 +1,7 @@
+import asyncio
 import sys
-from typing import List, Optional, TypedDict
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple, TypedDict
 
 from dotenv import load_dotenv
 from langgraph.graph import StateGraph, END
@@ -9,7 +11,7 @@ from .executor import Executor
 from .verifier import Verifier
 from .tools.rag_tool import rag_lookup
 from .approvals import ApprovalRequest, approval_provider_from_env
-from .evals import EvalRecord, eval_recorder_from_env
+from .evals import EvalRecord, NoopEvalRecorder, eval_recorder_from_env
 from .guardrails import guardrails_from_env
 from .llm import LLMSettings, get_chat_model
 from .rules import Intent, RuleContext, RuleDecision, RulesEngine, rules_from_env
@@ -167,11 +169,17 @@ def build_graph():
     return graph.compile()
 
 
-def run(task: str) -> AgentState:
-    app = build_graph()
-    initial_state: AgentState = {
+# run() and stream() share this graph, so LLM, guardrail, rules and approval settings
+# are read from the environment once; call _get_graph.cache_clear() after changing them.
+@lru_cache(maxsize=1)
+def _get_graph():
+    return build_graph()
+
+
+def _initial_state(task: str) -> AgentState:
+    return {
         "task": task,
-        "plan": Plan(goal=task, steps=[]),
+        "plan": Plan.model_construct(goal=task, steps=[]),
         "context": "",
         "result": "",
         "verified": False,
@@ -187,9 +195,12 @@ def run(task: str) -> AgentState:
         "guardrail_notes": [],
         "blocked": False,
     }
-    state = app.invoke(initial_state)
 
+
+def _record(state: AgentState) -> None:
     eval_recorder = eval_recorder_from_env()
+    if isinstance(eval_recorder, NoopEvalRecorder):
+        return
     plan_dump = state["plan"].model_dump() if state.get("plan") else None
     record = EvalRecord(
         task=state["task"],
@@ -210,9 +221,30 @@ def run(task: str) -> AgentState:
         },
     )
     eval_recorder.record(record)
+
+
+def run(task: str) -> AgentState:
+    app = _get_graph()
+    state = app.invoke(_initial_state(task))
+    _record(state)
     return state
 
 
+async def arun(task: str) -> AgentState:
+    return await asyncio.to_thread(run, task)
+
+
+def stream(task: str) -> Iterator[Tuple[str, AgentState]]:
+    app = _get_graph()
+    state = _initial_state(task)
+    for update in app.stream(state, stream_mode="updates"):
+        for node, node_state in update.items():
+            state = {**state, **node_state}
+            yield node, state
+    # Only completed runs are recorded; closing the generator early skips the eval record.
+    _record(state)
+
+
 def main(args: List[str]) -> None:
     setup_logging()
     load_dotenv()
@@ -222,10 +254,11 @@ def main(args: List[str]) -> None:
         sys.exit(1)
 
     task = " ".join(args)
-    state = run(task)
-    print("Plan:")
-    for step in state["plan"].steps:
-        print(f"- {step.step}")
+    for node, state in stream(task):
+        if node == "plan":
+            print("Plan:")
+            for step in state["plan"].steps:
+                print(f"- {step.step}")
     print("\nIntent:", state.get("intent"))
     if state.get("policy_notes"):
         print("Policy notes:", " | ".join(state.get("policy_notes")))
@@ -1,3 +1,3 @@
-from .recorder import EvalRecord, eval_recorder_from_env
+from .recorder import EvalRecord, NoopEvalRecorder, eval_recorder_from_env
 
-__all__ = ["EvalRecord", "eval_recorder_from_env"]
+__all__ = ["EvalRecord", "NoopEvalRecorder", "eval_recorder_from_env"]
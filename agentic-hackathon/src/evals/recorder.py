@@ -2,8 +2,14 @@ import json
 import logging
 import os
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from typing import Any, Dict, Optional, Protocol
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -32,11 +38,22 @@ class NoopEvalRecorder:
 class JsonlEvalRecorder:
     def __init__(self, path: str) -> None:
         self.path = path
+        self._directory_ready = False
 
-    def record(self, record: EvalRecord) -> None:
+    def _ensure_directory(self) -> None:
+        if self._directory_ready:
+            return
         directory = os.path.dirname(self.path)
         if directory:
             os.makedirs(directory, exist_ok=True)
+        self._directory_ready = True
+
+    def record(self, record: EvalRecord) -> None:
+        self._ensure_directory()
+        if orjson is not None:
+            with open(self.path, "ab") as handle:
+                handle.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+            return
         with open(self.path, "a", encoding="utf-8") as handle:
             handle.write(json.dumps(asdict(record)) + "\n")
 
@@ -64,15 +81,19 @@ class LangSmithEvalRecorder:
 
 def eval_recorder_from_env() -> EvalRecorder:
     mode = os.getenv("EVAL_RECORDER", "noop").lower()
+    path = os.getenv("EVAL_OUTPUT_PATH", "./evals/records.jsonl")
+    project = os.getenv("LANGSMITH_PROJECT", "agentic-hackathon")
+    return _recorder_for(mode, path, project)
+
+
+@lru_cache(maxsize=8)
+def _recorder_for(mode: str, path: str, project: str) -> EvalRecorder:
     if mode == "jsonl":
-        path = os.getenv("EVAL_OUTPUT_PATH", "./evals/records.jsonl")
         return JsonlEvalRecorder(path)
     if mode == "langsmith":
-        project = os.getenv("LANGSMITH_PROJECT", "agentic-hackathon")
         try:
             return LangSmithEvalRecorder(project)
         except RuntimeError as exc:
             logger.warning("LangSmith unavailable: %s", exc)
-            path = os.getenv("EVAL_OUTPUT_PATH", "./evals/records.jsonl")
             return JsonlEvalRecorder(path)
     return NoopEvalRecorder()
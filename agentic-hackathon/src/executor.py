@@ -59,24 +59,28 @@ class Executor:
             custom_tool,
             mcp_tool,
         ]
+        self._bound_llm = llm.bind_tools(self.tools)
 
     def execute(self, task: str, context: str, policy: Optional[RuleDecision] = None) -> str:
         system_parts = ["Use tools when helpful. Keep responses concise."]
         if policy and policy.system_instructions:
             system_parts.extend(policy.system_instructions)
         allowed_tools = self.tools
+        bound_llm = self._bound_llm
         if policy and policy.allowed_tools is not None:
             allowed_tools = [tool for tool in self.tools if tool.name in policy.allowed_tools]
+            bound_llm = self.llm.bind_tools(allowed_tools)
         messages = [
             SystemMessage(content="\n".join(system_parts)),
             HumanMessage(content=f"Task: {task}\nContext: {context}"),
         ]
-        response = self.llm.bind_tools(allowed_tools).invoke(messages)
+        response = bound_llm.invoke(messages)
 
         if response.tool_calls:
+            tools_by_name = {t.name: t for t in allowed_tools}
             outputs: List[str] = []
             for call in response.tool_calls:
-                tool_fn = {t.name: t for t in allowed_tools}.get(call["name"])
+                tool_fn = tools_by_name.get(call["name"])
                 if not tool_fn:
                     outputs.append(f"{call['name']}: blocked by tool policy")
                     continue
@@ -45,8 +45,11 @@ class MaxLengthGuardrail:
 class RegexBlocklistGuardrail:
     def __init__(self, patterns: Iterable[str]) -> None:
         self.patterns = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        self._combined = _combine_patterns(self.patterns)
 
     def _check_text(self, text: str) -> GuardrailVerdict:
+        if self._combined is not None and not self._combined.search(text):
+            return GuardrailVerdict(passed=True)
         matches = [pattern.pattern for pattern in self.patterns if pattern.search(text)]
         if matches:
             return GuardrailVerdict(
@@ -62,6 +65,24 @@ class RegexBlocklistGuardrail:
         return self._check_text(result)
 
 
+# Numbered backreferences (\1) and conditionals ((?(1)...)) would point at the wrong
+# group once patterns are joined, so such patterns are always checked one by one.
+_NUMBERED_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?\(\d")
+
+
+def _combine_patterns(patterns: List[re.Pattern]) -> Optional[re.Pattern]:
+    if not patterns or any(
+        _NUMBERED_GROUP_REFERENCE.search(pattern.pattern) for pattern in patterns
+    ):
+        return None
+    try:
+        return re.compile(
+            "|".join(f"(?:{pattern.pattern})" for pattern in patterns), re.IGNORECASE
+        )
+    except re.error:
+        return None
+
+
 class Guardrails:
     def __init__(self, guardrails: Iterable[Guardrail]) -> None:
         self.guardrails = list(guardrails)
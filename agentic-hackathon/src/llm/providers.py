@@ -108,6 +108,9 @@ class MockChatModel:
             return _default_structured(self._structured_schema)
         return MockChatResponse(content="mock-response", tool_calls=[])
 
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.invoke(*args, **kwargs)
+
 
 class MockProvider:
     def get_chat_model(self, settings: LLMSettings) -> ChatModel:
@@ -3,19 +3,21 @@ from langchain_core.prompts import ChatPromptTemplate
 from .utils.schemas import Plan
 
 
+_PLAN_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            "You are a precise planner. Return a concise plan with 3-7 steps.",
+        ),
+        ("human", "Goal: {goal}"),
+    ]
+)
+
+
 class Planner:
     def __init__(self, llm):
         self.llm = llm
+        self.chain = _PLAN_PROMPT | llm.with_structured_output(Plan)
 
     def generate_plan(self, goal: str) -> Plan:
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "You are a precise planner. Return a concise plan with 3-7 steps.",
-                ),
-                ("human", "Goal: {goal}"),
-            ]
-        )
-        chain = prompt | self.llm.with_structured_output(Plan)
-        return chain.invoke({"goal": goal})
+        return self.chain.invoke({"goal": goal})
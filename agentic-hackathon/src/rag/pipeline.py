@@ -15,6 +15,13 @@ class RAGConfig:
     missing_index_message: str = "RAG index missing. Run the ingest script to build it."
     allow_dangerous_deserialization: bool = True
 
+    @classmethod
+    def from_env(cls) -> "RAGConfig":
+        index_path = os.getenv("RAG_INDEX_PATH", "./data/faiss_index")
+        embedding_model = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+        k = int(os.getenv("RAG_TOP_K", "4"))
+        return cls(index_path=index_path, embedding_model=embedding_model, k=k)
+
 
 VectorstoreLoader = Callable[[str, str, bool], FAISS]
 
@@ -32,21 +39,23 @@ class RAGPipeline:
     ) -> None:
         self.config = config
         self.loader = loader
+        self._vectorstore: Optional[FAISS] = None
 
     @classmethod
     def from_env(cls) -> "RAGPipeline":
-        index_path = os.getenv("RAG_INDEX_PATH", "./data/faiss_index")
-        embedding_model = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
-        k = int(os.getenv("RAG_TOP_K", "4"))
-        config = RAGConfig(index_path=index_path, embedding_model=embedding_model, k=k)
-        return cls(config=config)
+        return cls(config=RAGConfig.from_env())
+
+    def _get_vectorstore(self) -> FAISS:
+        if self._vectorstore is None:
+            self._vectorstore = self.loader(
+                self.config.index_path,
+                self.config.embedding_model,
+                self.config.allow_dangerous_deserialization,
+            )
+        return self._vectorstore
 
     def retrieve(self, query: str) -> List[Document]:
-        vectorstore = self.loader(
-            self.config.index_path,
-            self.config.embedding_model,
-            self.config.allow_dangerous_deserialization,
-        )
+        vectorstore = self._get_vectorstore()
         return vectorstore.similarity_search(query, k=self.config.k)
 
     @staticmethod
@@ -1,6 +1,26 @@
-from ..rag import RAGPipeline
+import os
+from functools import lru_cache
+
+from ..rag import RAGConfig, RAGPipeline
+from ..utils.cache import TTLCache
+
+
+_cache = TTLCache(maxsize=256)
+
+
+@lru_cache(maxsize=8)
+def _pipeline_for(config: RAGConfig) -> RAGPipeline:
+    return RAGPipeline(config=config)
 
 
 def rag_lookup(query: str) -> str:
-    pipeline = RAGPipeline.from_env()
-    return pipeline.lookup(query)
+    ttl = float(os.getenv("RAG_CACHE_TTL_SECONDS", "60"))
+    pipeline = _pipeline_for(RAGConfig.from_env())
+    key = (pipeline.config, query)
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+    output = pipeline.lookup(query)
+    if output != pipeline.config.missing_index_message:
+        _cache.set(key, output, ttl=ttl)
+    return output
@@ -1,7 +1,11 @@
 import os
 import urllib.parse
 
-import requests
+from ..utils.cache import TTLCache
+from ..utils.http_session import get_session
+
+
+_cache = TTLCache(maxsize=256)
 
 
 def web_search(query: str) -> str:
@@ -9,12 +13,20 @@ def web_search(query: str) -> str:
     if not enabled:
         return "Web search disabled. Set WEB_SEARCH_ENABLED=true to enable."
 
+    ttl = float(os.getenv("WEB_SEARCH_CACHE_TTL_SECONDS", "120"))
+    normalized = query.strip().lower()
+    cached = _cache.get(normalized)
+    if cached is not None:
+        return cached
+
     url = "https://api.duckduckgo.com/?q={}&format=json&no_html=1".format(
-        urllib.parse.quote(query)
+        urllib.parse.quote(normalized)
     )
-    response = requests.get(url, timeout=10)
+    response = get_session().get(url, timeout=10)
     response.raise_for_status()
     data = response.json()
     abstract = data.get("AbstractText") or "No abstract available."
     heading = data.get("Heading") or "Results"
-    return f"{heading}: {abstract}"
\ No newline at end of file
+    output = f"{heading}: {abstract}"
+    _cache.set(normalized, output, ttl=ttl)
+    return output
\ No newline at end of file
@@ -0,0 +1,14 @@
+import threading
+
+import requests
+
+
+_local = threading.local()
+
+
+def get_session() -> requests.Session:
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _local.session = session
+    return session
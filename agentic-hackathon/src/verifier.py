@@ -7,19 +7,21 @@ class Verification(BaseModel):
     notes: str = Field(..., description="Short reason or corrections.")
 
 
+_VERIFY_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            "Check if the result satisfies the task. Return a verdict and notes.",
+        ),
+        ("human", "Task: {task}\nResult: {result}"),
+    ]
+)
+
+
 class Verifier:
     def __init__(self, llm):
         self.llm = llm
+        self.chain = _VERIFY_PROMPT | llm.with_structured_output(Verification)
 
     def verify(self, task: str, result: str) -> Verification:
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    "Check if the result satisfies the task. Return a verdict and notes.",
-                ),
-                ("human", "Task: {task}\nResult: {result}"),
-            ]
-        )
-        chain = prompt | self.llm.with_structured_output(Verification)
-        return chain.invoke({"task": task, "result": result})
+        return self.chain.invoke({"task": task, "result": result})
@@ -1,3 +1,6 @@
+import asyncio
+
+from src.agent_core import _get_graph, arun, run
 from src.deepagents_harness import DeepAgentsHarness, StepResult
 
 
@@ -7,4 +10,27 @@ def test_harness_runs_steps():
 
     harness = DeepAgentsHarness([step])
     results = harness.run("hello")
-    assert results[0].output == "hello"
\ No newline at end of file
+    assert results[0].output == "hello"
+
+def test_graph_keeps_env_settings_until_cache_clear(monkeypatch, tmp_path):
+    monkeypatch.setenv("LLM_PROVIDER", "mock")
+    monkeypatch.setenv("RAG_INDEX_PATH", str(tmp_path / "missing"))
+    monkeypatch.setenv("RULESET", "default")
+    _get_graph.cache_clear()
+    graph = _get_graph()
+
+    monkeypatch.setenv("RULESET", "commerce")
+    assert _get_graph() is graph
+    assert run("I need a refund")["intent"] == "general"
+
+    _get_graph.cache_clear()
+    assert run("I need a refund")["intent"] == "refund_request"
+    _get_graph.cache_clear()
+
+
+def test_arun_returns_same_state_as_run(monkeypatch, tmp_path):
+    monkeypatch.setenv("LLM_PROVIDER", "mock")
+    monkeypatch.setenv("RAG_INDEX_PATH", str(tmp_path / "missing"))
+    _get_graph.cache_clear()
+    assert asyncio.run(arun("hello")) == run("hello")
+    _get_graph.cache_clear()
@@ -0,0 +1,23 @@
+from src.agent_core import _get_graph, run, stream
+
+
+def test_stream_yields_nodes_in_order_and_matches_run(monkeypatch, tmp_path):
+    monkeypatch.setenv("LLM_PROVIDER", "mock")
+    monkeypatch.setenv("RAG_INDEX_PATH", str(tmp_path / "missing"))
+    _get_graph.cache_clear()
+
+    steps = list(stream("hello"))
+
+    assert [node for node, _ in steps] == [
+        "plan",
+        "classify",
+        "retrieve",
+        "rules",
+        "guardrail_input",
+        "approval",
+        "execute",
+        "guardrail_output",
+        "verify",
+    ]
+    assert steps[-1][1] == run("hello")
+    _get_graph.cache_clear()
@@ -0,0 +1,20 @@
+from src.utils.cache import TTLCache
+
+
+def test_ttl_cache_expires_entries():
+    now = [0.0]
+    cache = TTLCache(maxsize=4, clock=lambda: now[0])
+    cache.set("query", "context", ttl=10)
+    assert cache.get("query") == "context"
+    now[0] = 11.0
+    assert cache.get("query") is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", "1", ttl=60)
+    cache.set("b", "2", ttl=60)
+    cache.get("a")
+    cache.set("c", "3", ttl=60)
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
@@ -0,0 +1,23 @@
+import os
+
+from src.evals import EvalRecord, eval_recorder_from_env
+
+
+def test_jsonl_recorder_creates_directory_once_across_runs(tmp_path, monkeypatch):
+    output_path = tmp_path / "evals" / "records.jsonl"
+    monkeypatch.setenv("EVAL_RECORDER", "jsonl")
+    monkeypatch.setenv("EVAL_OUTPUT_PATH", str(output_path))
+    makedirs_calls = []
+    real_makedirs = os.makedirs
+
+    def counting_makedirs(*args, **kwargs):
+        makedirs_calls.append(args[0])
+        return real_makedirs(*args, **kwargs)
+
+    monkeypatch.setattr(os, "makedirs", counting_makedirs)
+    record = EvalRecord("task", "general", None, "result", True, "notes", {})
+    eval_recorder_from_env().record(record)
+    eval_recorder_from_env().record(record)
+
+    assert makedirs_calls == [str(output_path.parent)]
+    assert len(output_path.read_text(encoding="utf-8").splitlines()) == 2
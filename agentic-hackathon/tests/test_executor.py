@@ -1,7 +1,37 @@
+from src.rag import RAGPipeline
 from src.tools.rag_tool import rag_lookup
 
 
 def test_rag_lookup_missing_index(tmp_path, monkeypatch):
     monkeypatch.setenv("RAG_INDEX_PATH", str(tmp_path / "missing"))
     output = rag_lookup("test query")
-    assert "RAG index missing" in output
\ No newline at end of file
+    assert "RAG index missing" in output
+
+
+def test_rag_lookup_caches_repeated_queries(tmp_path, monkeypatch):
+    monkeypatch.setenv("RAG_INDEX_PATH", str(tmp_path))
+    calls = []
+
+    def fake_lookup(self, query: str) -> str:
+        calls.append(query)
+        return f"context for {query}"
+
+    monkeypatch.setattr(RAGPipeline, "lookup", fake_lookup)
+    assert rag_lookup("refund policy") == "context for refund policy"
+    assert rag_lookup("refund policy") == "context for refund policy"
+    assert calls == ["refund policy"]
+
+
+def test_rag_lookup_does_not_cache_missing_index(tmp_path, monkeypatch):
+    monkeypatch.setenv("RAG_INDEX_PATH", str(tmp_path / "missing"))
+    calls = []
+    original_lookup = RAGPipeline.lookup
+
+    def counting_lookup(self, query: str) -> str:
+        calls.append(query)
+        return original_lookup(self, query)
+
+    monkeypatch.setattr(RAGPipeline, "lookup", counting_lookup)
+    rag_lookup("refund policy")
+    rag_lookup("refund policy")
+    assert calls == ["refund policy", "refund policy"]
@@ -11,3 +11,18 @@ def test_max_length_guardrail_blocks_large_input():
     guardrails = Guardrails([MaxLengthGuardrail(max_input_chars=5, max_output_chars=100)])
     verdict = guardrails.check_input("hello world", "")
     assert verdict.passed is False
+
+
+def test_blocklist_guardrail_reports_each_matching_pattern():
+    guardrail = RegexBlocklistGuardrail(["secret", r"api[_-]?key", "password"])
+    assert guardrail.check_output("task", "nothing sensitive here").passed is True
+    verdict = guardrail.check_output("task", "secret API_KEY inside")
+    assert verdict.passed is False
+    assert verdict.notes == ["Blocked by guardrail patterns: secret, api[_-]?key"]
+
+
+def test_blocklist_guardrail_checks_numbered_group_references_individually():
+    guardrail = RegexBlocklistGuardrail(["(x)?y", r"(a)?(?(1)b|c)z", r"(q)\1"])
+    assert guardrail.check_output("task", "abz").passed is False
+    assert guardrail.check_output("task", "qq").passed is False
+    assert guardrail.check_output("task", "clean").passed is True
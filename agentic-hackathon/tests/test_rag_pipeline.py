@@ -0,0 +1,19 @@
+from src.rag import RAGConfig, RAGPipeline
+
+
+class FakeVectorstore:
+    def similarity_search(self, query: str, k: int) -> list:
+        return []
+
+
+def test_rag_pipeline_loads_index_once(tmp_path):
+    calls = []
+
+    def loader(index_path: str, embedding_model: str, allow_dangerous: bool) -> FakeVectorstore:
+        calls.append(index_path)
+        return FakeVectorstore()
+
+    pipeline = RAGPipeline(RAGConfig(index_path=str(tmp_path)), loader=loader)
+    pipeline.retrieve("first")
+    pipeline.retrieve("second")
+    assert calls == [str(tmp_path)]
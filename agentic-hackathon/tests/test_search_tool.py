@@ -0,0 +1,39 @@
+from src.tools import search_tool
+
+
+class FakeResponse:
+    def raise_for_status(self) -> None:
+        return None
+
+    def json(self) -> dict:
+        return {"Heading": "Phones", "AbstractText": "Budget phones."}
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.urls = []
+
+    def get(self, url: str, timeout: int) -> FakeResponse:
+        self.urls.append(url)
+        return FakeResponse()
+
+
+def test_web_search_serves_repeated_queries_from_cache(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(search_tool, "get_session", lambda: session)
+    monkeypatch.setenv("WEB_SEARCH_ENABLED", "true")
+    first = search_tool.web_search("Cached Phone Query")
+    second = search_tool.web_search("  cached phone query ")
+    assert first == second == "Phones: Budget phones."
+    assert len(session.urls) == 1
+    assert "q=cached%20phone%20query" in session.urls[0]
+
+
+def test_web_search_does_not_cache_disabled_message(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(search_tool, "get_session", lambda: session)
+    monkeypatch.setenv("WEB_SEARCH_ENABLED", "false")
+    assert "disabled" in search_tool.web_search("uncached disabled query")
+    monkeypatch.setenv("WEB_SEARCH_ENABLED", "true")
+    assert search_tool.web_search("uncached disabled query") == "Phones: Budget phones."
+    assert len(session.urls) == 1